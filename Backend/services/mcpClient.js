@@ -16,12 +16,14 @@ class MCPClient {
   /**
    * Exécute un tool via le MCP Server Python
    */
-  async callTool(toolName, toolArgs) {
+  async callTool(toolName, toolArgs, env = {}) {
     return new Promise((resolve, reject) => {
       console.log(`🔧 [MCP Client] Calling Python tool: ${toolName}`, toolArgs);
-      
-      // ⭐ Spawn du process Python
-      const mcpProcess = spawn(this.pythonPath, [this.mcpServerPath]);
+
+      // ⭐ Spawn du process Python (env : variables MCP_* optionnelles, ex: MCP_EXPORT_DIR)
+      const mcpProcess = spawn(this.pythonPath, [this.mcpServerPath], {
+        env: { ...process.env, ...env }
+      });
       
       let stdout = '';
       let stderr = '';
@@ -125,12 +127,15 @@ class MCPClient {
   
   /**
    * Scrape plusieurs cinémas en séquence
+   * @param {string[]} cinemaIds - IDs des cinémas UGC
+   * @param {Object} options - exportDir : dossier de l'export colonnaire (Arrow)
    */
-  async scrapeMultipleCinemas(cinemaIds) {
+  async scrapeMultipleCinemas(cinemaIds, options = {}) {
     try {
+      const env = options.exportDir ? { MCP_EXPORT_DIR: options.exportDir } : {};
       const result = await this.callTool('scrape_multiple_ugc_cinemas', {
         cinema_ids: cinemaIds.map(String)
-      });
+      }, env);
       
       return {
         success: true,
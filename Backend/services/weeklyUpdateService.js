@@ -1,9 +1,18 @@
+import path from 'path';
+import { fileURLToPath } from 'url';
 import UgcFilm from '../models/ugcFilm.js';
 import Cinema from '../models/cinema.js';
 import dataTransformService from './dataTransformService.js';
 import mcpClient from './mcpClient.js';
 import embeddingService from './embeddingService.js';
 
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+// Export colonnaire des séances (un sous-dossier par run, relu par load_exports côté Python)
+const SHOWTIMES_EXPORT_ROOT = process.env.SHOWTIMES_EXPORT_DIR ||
+  path.join(__dirname, '../../mcp-server/output/showtimes');
+
 class WeeklyUpdateService {
   /**
    * Pipeline complet de mise à jour de la base vectorielle
@@ -55,6 +64,10 @@ class WeeklyUpdateService {
 
       console.log(`   📦 Découpage en ${batches.length} batch(s) de max ${BATCH_SIZE} cinémas`);
 
+      // Chaque batch écrit son export Arrow dans le dossier du run
+      const exportDir = path.join(SHOWTIMES_EXPORT_ROOT, new Date().toISOString().slice(0, 10));
+      console.log(`   🗂️  Export colonnaire: ${exportDir}`);
+
       let allScrapedData = { cinemas: [] };
       let batchNumber = 0;
 
@@ -62,7 +75,7 @@ class WeeklyUpdateService {
         batchNumber++;
         console.log(`\n   🔄 Batch ${batchNumber}/${batches.length} (${batch.length} cinémas)...`);
 
-        const scrapingResult = await mcpClient.scrapeMultipleCinemas(batch);
+        const scrapingResult = await mcpClient.scrapeMultipleCinemas(batch, { exportDir });
 
         if (!scrapingResult.success) {
           console.warn(`   ⚠️  Erreur batch ${batchNumber}: ${scrapingResult.error}`);
@@ -74,6 +87,13 @@ class WeeklyUpdateService {
           const batchData = JSON.parse(scrapingResult.content);
           allScrapedData.cinemas.push(...batchData.cinemas);
           console.log(`   ✅ Batch ${batchNumber} OK: ${batchData.cinemas?.length || 0} cinémas`);
+
+          // Dates non récupérées malgré les retries : semaine partielle pour ces cinémas
+          for (const cinema of batchData.cinemas) {
+            if (cinema.failed_dates?.length) {
+              console.warn(`   ⚠️  Cinéma ${cinema.cinema_id}: dates manquantes ${cinema.failed_dates.join(', ')}`);
+            }
+          }
         } catch (error) {
           console.error(`   ❌ Erreur parsing batch ${batchNumber}:`, error.message);
         }
@@ -154,7 +174,8 @@ class WeeklyUpdateService {
         films_created: result.upsertedCount,
         films_updated: result.modifiedCount,
         duration_seconds: parseFloat(duration),
-        week_number: currentWeek
+        week_number: currentWeek,
+        export_dir: exportDir
       };
 
     } catch (error) {
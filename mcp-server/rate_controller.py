@@ -0,0 +1,234 @@
+"""
+Contrôle adaptatif (AIMD) de la concurrence et du débit des requêtes vers ugc.fr
+
+- Succès rapide : la fenêtre (requêtes simultanées) et le débit augmentent
+  de façon additive
+- 429, 5xx ou erreur réseau : fenêtre et débit divisés par deux, puis nouvel
+  essai après un backoff aléatoire (GET idempotents)
+- 403 (blocage anti-bot probable) : même diminution, sans retry ; les autres
+  4xx ne modifient ni la fenêtre ni le débit
+- Latence en hausse sur un endpoint : même diminution, mais le débit ne
+  descend pas sous latency_min_rate (seuls 429/5xx vont plus bas)
+
+La latence de référence est le minimum glissant des dernières réponses de
+chaque endpoint (page cinéma et AJAX ont des latences différentes).
+
+L'état courant (fenêtre, débit, retries...) est exposé par stats() pour être
+renvoyé dans la sortie des tools MCP.
+"""
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class AdaptiveController:
+    def __init__(
+        self,
+        initial_window: float = 2.0,
+        max_window: int = 8,
+        initial_rate: float = 3.0,
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        latency_factor: float = 2.0,
+        latency_slack: float = 0.1,
+        latency_window: int = 20,
+        latency_min_rate: float = 3.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 10.0,
+        timeout: float = 15.0,
+    ):
+        """
+        Args:
+            initial_window: Requêtes simultanées au démarrage
+            max_window: Plafond de requêtes simultanées
+            initial_rate: Débit de départ (requêtes/s)
+            min_rate, max_rate: Bornes du débit (requêtes/s)
+            latency_factor: Latence > latency_factor × latence minimale observée = congestion
+            latency_slack: Écart minimal (secondes) à la latence minimale pour parler de
+                congestion (évite de réagir au bruit sur des latences très faibles)
+            latency_window: Nombre de réponses par endpoint pour le minimum glissant
+            latency_min_rate: Débit plancher pour une baisse due à la latence seule
+                (≈ l'ancien sleep fixe de 0.3 s)
+            max_retries: Nombre de nouveaux essais par requête
+            backoff_base, backoff_cap: Backoff exponentiel avec jitter (secondes)
+            timeout: Timeout HTTP par requête (secondes)
+        """
+        self.max_window = max_window
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.latency_factor = latency_factor
+        self.latency_slack = latency_slack
+        self.latency_window = latency_window
+        self.latency_min_rate = latency_min_rate
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+
+        self.window = float(initial_window)
+        self.rate = float(initial_rate)
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._last_decrease = float("-inf")
+        self._avg_latency: Optional[float] = None
+        # url → {"samples": dernières latences, "avg": EWMA}
+        self._endpoints: Dict[str, Dict] = {}
+
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.errors = 0
+
+    def get(self, http_get: Callable, url: str, **kwargs):
+        """
+        Exécute un GET via le contrôleur (fenêtre + pacing + retries)
+
+        Args:
+            http_get: Fonction GET (ex: requests.get)
+            url: URL à récupérer
+            **kwargs: Paramètres passés à http_get
+
+        Returns:
+            La réponse HTTP (raise_for_status() déjà appelé)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            self._acquire()
+            start = time.monotonic()
+            try:
+                response = http_get(url, **kwargs)
+            except OSError:
+                # requests.RequestException (connexion, timeout...) hérite d'OSError
+                self._on_congestion(throttled=False)
+                if attempt == self.max_retries:
+                    raise
+            else:
+                latency = time.monotonic() - start
+
+                if response.status_code < 400:
+                    self._on_success(url, latency)
+                    return response
+
+                if response.status_code not in RETRYABLE_STATUS:
+                    # Erreur non réessayable (404...) : ni retry ni augmentation ;
+                    # un 403 est probablement un blocage anti-bot → on ralentit
+                    if response.status_code == 403:
+                        self._on_congestion(throttled=True)
+                    response.raise_for_status()
+                    return response
+
+                self._on_congestion(throttled=response.status_code == 429)
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+                retry_after = self._parse_retry_after(response)
+            finally:
+                self._release()
+
+            with self._cond:
+                self.retries += 1
+            time.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+    def stats(self) -> Dict:
+        """État courant du contrôleur (pour la sortie des tools)"""
+        with self._cond:
+            return {
+                "window": round(self.window, 2),
+                "rate_per_s": round(self.rate, 2),
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "avg_latency_ms": (
+                    round(self._avg_latency * 1000) if self._avg_latency is not None else None
+                ),
+            }
+
+    def _acquire(self) -> None:
+        """Attend une place dans la fenêtre puis le créneau de départ imposé par le débit"""
+        with self._cond:
+            while self._in_flight >= max(1, int(self.window)):
+                self._cond.wait()
+            self._in_flight += 1
+            self.requests += 1
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + 1.0 / self.rate
+
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _on_success(self, url: str, latency: float) -> None:
+        """
+        Augmentation additive, sauf si la latence moyenne de l'endpoint dépasse
+        sa référence (minimum glissant) et continue de monter
+        """
+        with self._cond:
+            if self._avg_latency is None:
+                self._avg_latency = latency
+            else:
+                self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+
+            endpoint = self._endpoints.setdefault(
+                url, {"samples": deque(maxlen=self.latency_window), "avg": None}
+            )
+            endpoint["samples"].append(latency)
+            previous_avg = endpoint["avg"]
+            avg = latency if previous_avg is None else 0.8 * previous_avg + 0.2 * latency
+            endpoint["avg"] = avg
+
+            baseline = min(endpoint["samples"])
+            threshold = max(self.latency_factor * baseline, baseline + self.latency_slack)
+            rising = previous_avg is not None and avg - previous_avg > 0.01 * avg
+            if avg > threshold and rising:
+                self._decrease(rate_floor=max(self.min_rate, self.latency_min_rate))
+                return
+
+            self.window = min(self.max_window, self.window + 1.0 / self.window)
+            self.rate = min(self.max_rate, self.rate + 1.0 / self.window)
+            self._cond.notify_all()
+
+    def _on_congestion(self, throttled: bool) -> None:
+        """Diminution multiplicative sur 429 / 5xx / erreur réseau"""
+        with self._cond:
+            if throttled:
+                self.throttled += 1
+            else:
+                self.errors += 1
+            self._decrease(rate_floor=self.min_rate)
+
+    def _decrease(self, rate_floor: float) -> None:
+        """Divise fenêtre et débit par deux, au plus une fois par latence moyenne
+        (les réponses d'une même rafale ne comptent que pour une congestion).
+        Le débit ne descend pas sous rate_floor, ni ne remonte s'il y est déjà."""
+        now = time.monotonic()
+        if now - self._last_decrease < (self._avg_latency or 0.0):
+            return
+        self._last_decrease = now
+        self.window = max(1.0, self.window / 2)
+        self.rate = max(min(self.rate, rate_floor), self.rate / 2)
+
+    def _backoff(self, attempt: int) -> float:
+        """Backoff exponentiel avec full jitter"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def _parse_retry_after(self, response) -> Optional[float]:
+        """Retry-After en secondes (plafonné à backoff_cap), None si absent ou invalide"""
+        value = response.headers.get("Retry-After") if response.headers else None
+        try:
+            return min(self.backoff_cap, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return None
@@ -1,13 +1,36 @@
 """
 UGC Cinema Scraper - Version adaptée pour MCP
+
+requests et bs4 sont importés au premier scraping (ou par warmup()) pour que
+le serveur MCP réponde à tools/list sans payer leur coût d'import.
 """
-import requests
 import re
+import sys
 import json
-import time
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+from rate_controller import AdaptiveController
+
+_requests = None
+_BeautifulSoup = None
+_deps_lock = threading.Lock()
+
+
+def _load_dependencies():
+    """Importe requests et BeautifulSoup une seule fois (thread-safe)"""
+    global _requests, _BeautifulSoup
+    if _requests is None:
+        with _deps_lock:
+            if _requests is None:
+                from bs4 import BeautifulSoup
+                import requests
+                _BeautifulSoup = BeautifulSoup
+                _requests = requests
+    return _requests, _BeautifulSoup
+
+
 class UGCScraper:
     def __init__(self):
         self.ugc_ajax_url = (
@@ -17,6 +40,16 @@ class UGCScraper:
             "User-Agent": "Mozilla/5.0",
             "X-Requested-With": "XMLHttpRequest",
         }
+        # Concurrence et débit vers ugc.fr ajustés selon latence / 429 / 5xx
+        self.controller = AdaptiveController()
+
+    def warmup(self) -> None:
+        """Pré-charge les dépendances lourdes (appelé en arrière-plan par le serveur)"""
+        _load_dependencies()
+
+    def dependencies_loaded(self) -> bool:
+        """True si requests et bs4 sont déjà importés"""
+        return _requests is not None
     
     def scrape_cinema(self, cinema_id: int, cinema_name: str = "") -> Dict:
         """
@@ -42,12 +75,21 @@ class UGCScraper:
                     "error": "Aucune date disponible trouvée"
                 }
             
-            # STEP 2: Scrape les films pour chaque date
+            # STEP 2: Scrape les films pour chaque date (en parallèle, borné par le contrôleur)
+            dates = available_dates[:7]  # Limite à 7 jours
             film_index = {}
-            
-            for date_str in available_dates[:7]:  # Limite à 7 jours
-                daily_films = self._scrape_day(cinema_id, date_str)
-                
+            failed_dates = []
+
+            with ThreadPoolExecutor(max_workers=self.controller.max_window) as pool:
+                daily_results = list(pool.map(
+                    lambda date_str: self._scrape_day_safe(cinema_id, date_str), dates
+                ))
+
+            for date_str, daily_films in zip(dates, daily_results):
+                if daily_films is None:
+                    failed_dates.append(date_str)
+                    continue
+
                 for film in daily_films:
                     fid = film["film_id"]
                     
@@ -56,8 +98,14 @@ class UGCScraper:
                     else:
                         # Fusionne les horaires
                         film_index[fid]["showings"].update(film["showings"])
-                
-                time.sleep(0.3)  # Polite scraping
+
+            if len(failed_dates) == len(dates):
+                return {
+                    "success": False,
+                    "cinema_id": cinema_id,
+                    "error": "Échec du scraping pour toutes les dates",
+                    "scraping": self.controller.stats()
+                }
             
             # ⭐ Filtre: ne garde que les films avec au moins une séance programmée
             films_with_showings = [
@@ -75,20 +123,25 @@ class UGCScraper:
                 "films": films_with_showings,
                 "film_count": len(films_with_showings),
                 "total_films_scraped": len(film_index),
-                "films_filtered": len(film_index) - len(films_with_showings)
+                "films_filtered": len(film_index) - len(films_with_showings),
+                "failed_dates": failed_dates,
+                "scraping": self.controller.stats()
             }
             
         except Exception as e:
             return {
                 "success": False,
                 "cinema_id": cinema_id,
-                "error": str(e)
+                "error": str(e),
+                "scraping": self.controller.stats()
             }
     
     def _get_available_dates(self, cinema_page_url: str) -> List[str]:
         """Extrait les dates disponibles depuis la page principale"""
-        r = requests.get(cinema_page_url, headers={"User-Agent": "Mozilla/5.0"})
-        r.raise_for_status()
+        requests, BeautifulSoup = _load_dependencies()
+        r = self.controller.get(
+            requests.get, cinema_page_url, headers={"User-Agent": "Mozilla/5.0"}
+        )
         
         soup = BeautifulSoup(r.text, "html.parser")
         dates = []
@@ -99,8 +152,21 @@ class UGCScraper:
         
         return sorted(set(dates))
     
+    def _scrape_day_safe(self, cinema_id: int, date_str: str) -> Optional[List[Dict]]:
+        """
+        _scrape_day qui retourne None si la date échoue côté réseau/HTTP malgré
+        les retries. Les autres erreurs (parsing...) font échouer le cinéma.
+        """
+        try:
+            return self._scrape_day(cinema_id, date_str)
+        except OSError as e:
+            # requests.RequestException (dont HTTPError) hérite d'OSError
+            print(f"[Scraper] Cinéma {cinema_id}, {date_str}: {e}", file=sys.stderr)
+            return None
+
     def _scrape_day(self, cinema_id: int, date_str: str) -> List[Dict]:
         """Scrape les films pour une date donnée (via AJAX)"""
+        requests, BeautifulSoup = _load_dependencies()
         params = {
             "cinemaId": cinema_id,
             "date": date_str,
@@ -108,8 +174,9 @@ class UGCScraper:
             "searchFilmKey": "",
         }
         
-        r = requests.get(self.ugc_ajax_url, params=params, headers=self.headers)
-        r.raise_for_status()
+        r = self.controller.get(
+            requests.get, self.ugc_ajax_url, params=params, headers=self.headers
+        )
         
         soup = BeautifulSoup(r.text, "html.parser")
         films = []
@@ -3,10 +3,24 @@
 MCP Server Python pour le scraping UGC
 Communication via stdin/stdout (JSON-RPC 2.0)
 """
+import os
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from scraper_ugc import scraper
 
+# Pré-chargement de requests/bs4 en arrière-plan après un handshake tools/list
+# (désactivable avec MCP_PREWARM=0)
+PREWARM_ENABLED = os.environ.get("MCP_PREWARM", "1") != "0"
+
+# Export colonnaire des séances après scraping (désactivé si MCP_EXPORT_DIR est vide)
+EXPORT_DIR = os.environ.get("MCP_EXPORT_DIR", "")
+EXPORT_FORMAT = os.environ.get("MCP_EXPORT_FORMAT", "arrow")
+
+# Nombre de cinémas scrapés simultanément par scrape_multiple_ugc_cinemas
+MAX_PARALLEL_CINEMAS = 4
+
 def handle_list_tools():
     """Retourne la liste des tools disponibles"""
     return {
@@ -66,10 +80,13 @@ def handle_call_tool(tool_name, arguments):
                         {
                             "type": "text",
                             "text": f"❌ Erreur scraping cinéma {cinema_id}: {result.get('error')}"
-                        }
+                        },
+                        scraping_stats_content()
                     ]
                 }
             
+            export_results([result], str(cinema_id))
+
             # Formate le JSON pour le LLM
             formatted_text = format_for_llm(result)
             
@@ -78,7 +95,8 @@ def handle_call_tool(tool_name, arguments):
                     {
                         "type": "text",
                         "text": formatted_text
-                    }
+                    },
+                    scraping_stats_content()
                 ]
             }
         
@@ -88,21 +106,28 @@ def handle_call_tool(tool_name, arguments):
             print(f"[MCP Python] Scraping {len(cinema_ids)} cinémas...", file=sys.stderr)
 
             all_cinemas = []
+            all_results = []
             total_films = 0
             total_filtered = 0
 
-            for cinema_id in cinema_ids:
-                result = scraper.scrape_cinema(int(cinema_id))
+            # Cinémas scrapés en parallèle : le contrôleur adaptatif partagé borne les requêtes vers ugc.fr
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_CINEMAS) as pool:
+                results = list(pool.map(lambda cid: scraper.scrape_cinema(int(cid)), cinema_ids))
+
+            for cinema_id, result in zip(cinema_ids, results):
                 if result["success"]:
                     # Parse le JSON de chaque cinéma
                     cinema_json = json.loads(format_for_llm(result))
                     all_cinemas.append(cinema_json)
+                    all_results.append(result)
                     total_films += result.get("film_count", 0)
                     total_filtered += result.get("films_filtered", 0)
                     print(f"[MCP Python] Cinéma {cinema_id}: {result['film_count']} films avec séances ({result.get('films_filtered', 0)} filtrés)", file=sys.stderr)
 
             print(f"[MCP Python] Total: {total_films} films avec séances, {total_filtered} films sans séances filtrés", file=sys.stderr)
 
+            export_results(all_results, "multiple")
+
             # Combine tous les cinémas dans un seul JSON
             combined_data = {
                 "cinemas": all_cinemas,
@@ -115,7 +140,8 @@ def handle_call_tool(tool_name, arguments):
                     {
                         "type": "text",
                         "text": json.dumps(combined_data, ensure_ascii=False, separators=(',', ':')) if all_cinemas else "❌ Aucun cinéma n'a pu être scrapé"
-                    }
+                    },
+                    scraping_stats_content()
                 ]
             }
         
@@ -134,12 +160,42 @@ def handle_call_tool(tool_name, arguments):
             "isError": True
         }
 
+def scraping_stats_content():
+    """
+    Bloc de contenu avec l'état du contrôleur adaptatif (fenêtre, débit, retries).
+    Placé après le résultat : le client Node ne lit que content[0].
+    """
+    stats = scraper.controller.stats()
+    print(f"[MCP Python] Contrôleur: fenêtre {stats['window']}, {stats['rate_per_s']} req/s, "
+          f"{stats['requests']} requêtes, {stats['retries']} retries", file=sys.stderr)
+    return {
+        "type": "text",
+        "text": json.dumps({"scraping": stats}, separators=(',', ':'))
+    }
+
+def export_results(results: list, label: str):
+    """
+    Écrit l'export colonnaire (Arrow/Parquet) des cinémas scrapés si MCP_EXPORT_DIR
+    est défini. Un échec d'export est loggé mais ne fait pas échouer le tool.
+    """
+    if not EXPORT_DIR or not results:
+        return
+
+    try:
+        # Import à la demande : pyarrow ne doit pas ralentir le démarrage
+        from showtimes_export import export_showtimes
+
+        paths = export_showtimes(results, EXPORT_DIR, label=label, fmt=EXPORT_FORMAT)
+        print(f"[MCP Python] Export colonnaire: {paths['showtimes']}, {paths['films']}", file=sys.stderr)
+    except Exception as e:
+        print(f"[MCP Python] Erreur export colonnaire: {e}", file=sys.stderr)
+
 def format_for_llm(result: dict) -> str:
     """
     Formate les données scrapées en JSON structuré optimisé pour le LLM
 
     Retourne un JSON compact avec:
-    - Infos cinéma
+    - Infos cinéma (+ dates en échec après retries, failed_dates)
     - Liste des films avec métadonnées
     - Séances groupées par date (limité à 3 prochaines dates)
     """
@@ -199,6 +255,7 @@ def format_for_llm(result: dict) -> str:
     cinema_data = {
         "cinema_id": cinema.get("id"),
         "cinema_name": cinema.get("name"),
+        "failed_dates": result.get("failed_dates", []),
         "films": formatted_films
     }
 
@@ -242,6 +299,23 @@ def handle_request(request):
             }
         }
 
+def start_prewarm():
+    """
+    Lance le chargement des dépendances du scraper dans un thread daemon,
+    pour qu'un tools/call envoyé après tools/list les trouve déjà chargées.
+    Sans effet pour un client qui envoie directement tools/call (mcpClient.js) :
+    le scraping charge alors les dépendances lui-même.
+    """
+    def warmup():
+        try:
+            scraper.warmup()
+        except ImportError as e:
+            print(f"[MCP Python] Pré-chargement impossible: {e}", file=sys.stderr)
+
+    thread = threading.Thread(target=warmup, name="mcp-prewarm", daemon=True)
+    thread.start()
+    return thread
+
 def main():
     """
     Boucle principale : lit stdin, traite les requêtes, écrit sur stdout
@@ -259,6 +333,12 @@ def main():
             
             # Écrit la réponse sur stdout (JSON-RPC)
             print(json.dumps(response), flush=True)
+
+            # Handshake tools/list terminé : pré-chargement pendant que le client
+            # prépare son tools/call (inutile si un scraping a déjà tout chargé)
+            if (PREWARM_ENABLED and request.get("method") == "tools/list"
+                    and not scraper.dependencies_loaded()):
+                start_prewarm()
         
         except json.JSONDecodeError as e:
             print(f"[MCP Python] Invalid JSON: {e}", file=sys.stderr)
@@ -0,0 +1,232 @@
+"""
+Export colonnaire des séances UGC (Arrow IPC / Parquet)
+
+Chaque export produit deux tables :
+- <prefix>_showtimes : une ligne par séance
+  (cinema_id, cinema_name, film_id, date, start, end, version),
+  colonnes texte encodées en dictionnaire
+- <prefix>_films : métadonnées des films, une ligne par film_id
+
+Le format Arrow IPC n'est pas compressé : il se relit par memory-map sans
+copie, ce qui permet de recharger une semaine de séances de tout le réseau
+en quelques millisecondes. Parquet est plus compact pour l'archivage.
+
+Le scraping hebdomadaire écrit un export par batch de cinémas dans un même
+dossier : load_exports() les relit tous et les fusionne.
+"""
+import glob
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+FORMATS = ("arrow", "parquet")
+
+_dict_string = pa.dictionary(pa.int32(), pa.string())
+
+SHOWTIMES_SCHEMA = pa.schema([
+    ("cinema_id", pa.int32()),
+    ("cinema_name", _dict_string),
+    ("film_id", _dict_string),
+    ("date", pa.date32()),
+    ("start", _dict_string),
+    ("end", _dict_string),
+    ("version", _dict_string),
+])
+
+FILMS_SCHEMA = pa.schema([
+    ("film_id", pa.string()),
+    ("title", pa.string()),
+    ("genre", _dict_string),
+    ("duration", pa.string()),
+    ("duration_minutes", pa.int16()),
+    ("director", pa.string()),
+    ("actors", pa.string()),
+    ("rating", pa.float32()),
+    ("release_date", pa.string()),
+])
+
+
+def _parse_duration(duration_str: Optional[str]) -> Optional[int]:
+    """'2h43' → 163"""
+    if not duration_str:
+        return None
+    match = re.match(r"(\d+)h(\d+)?", duration_str)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2) or 0)
+    return None
+
+
+def build_tables(results: List[Dict]) -> Tuple[pa.Table, pa.Table]:
+    """
+    Convertit des résultats de scraper.scrape_cinema en tables Arrow
+
+    Args:
+        results: Résultats de scrape_cinema (les échecs sont ignorés)
+
+    Returns:
+        (showtimes, films)
+    """
+    showtimes = {name: [] for name in SHOWTIMES_SCHEMA.names}
+    films = {name: [] for name in FILMS_SCHEMA.names}
+    seen_films = set()
+
+    for result in results:
+        if not result.get("success"):
+            continue
+
+        cinema_id = result["cinema"]["id"]
+        cinema_name = result["cinema"]["name"]
+
+        for film in result["films"]:
+            fid = film["film_id"]
+
+            if fid not in seen_films:
+                seen_films.add(fid)
+                films["film_id"].append(fid)
+                films["title"].append(film.get("title"))
+                films["genre"].append(film.get("genre"))
+                films["duration"].append(film.get("duration"))
+                films["duration_minutes"].append(_parse_duration(film.get("duration")))
+                films["director"].append(film.get("director"))
+                films["actors"].append(film.get("actors"))
+                films["rating"].append(film.get("rating"))
+                films["release_date"].append(film.get("release_date"))
+
+            for date_str, seances in film["showings"].items():
+                day = date.fromisoformat(date_str)
+                for seance in seances:
+                    showtimes["cinema_id"].append(int(cinema_id))
+                    showtimes["cinema_name"].append(cinema_name)
+                    showtimes["film_id"].append(fid)
+                    showtimes["date"].append(day)
+                    showtimes["start"].append(seance.get("start"))
+                    showtimes["end"].append(seance.get("end"))
+                    showtimes["version"].append(seance.get("version"))
+
+    return (
+        _to_table(showtimes, SHOWTIMES_SCHEMA),
+        _to_table(films, FILMS_SCHEMA),
+    )
+
+
+def _to_table(columns: Dict[str, list], schema: pa.Schema) -> pa.Table:
+    """Construit une table en encodant en dictionnaire les colonnes qui le demandent"""
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            array = pa.array(columns[field.name], type=field.type.value_type)
+            arrays.append(array.dictionary_encode())
+        else:
+            arrays.append(pa.array(columns[field.name], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def export_showtimes(
+    results: List[Dict],
+    output_dir: str = "output",
+    label: str = "multiple",
+    fmt: str = "arrow",
+) -> Dict[str, str]:
+    """
+    Écrit les tables showtimes et films d'un ou plusieurs cinémas scrapés
+
+    Args:
+        results: Résultats de scraper.scrape_cinema
+        output_dir: Dossier de sortie (créé si besoin)
+        label: Suffixe du nom de fichier (ID du cinéma ou 'multiple')
+        fmt: 'arrow' (memory-map) ou 'parquet'
+
+    Returns:
+        Dict avec clés: showtimes, films (chemins des fichiers écrits)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format d'export inconnu: {fmt}")
+
+    showtimes, films = build_tables(results)
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    prefix = os.path.join(output_dir, f"ugc_{label}_{timestamp}")
+    # Deux batches dans la même seconde : ne pas écraser l'export précédent
+    suffix = 1
+    while os.path.exists(f"{prefix}_showtimes.{fmt}"):
+        prefix = os.path.join(output_dir, f"ugc_{label}_{timestamp}_{suffix}")
+        suffix += 1
+
+    paths = {
+        "showtimes": f"{prefix}_showtimes.{fmt}",
+        "films": f"{prefix}_films.{fmt}",
+    }
+    _write_table(showtimes, paths["showtimes"], fmt)
+    _write_table(films, paths["films"], fmt)
+    return paths
+
+
+def _write_table(table: pa.Table, path: str, fmt: str) -> None:
+    """Écrit une table en Arrow IPC (non compressé) ou en Parquet (zstd)"""
+    if fmt == "parquet":
+        pq.write_table(table, path, compression="zstd")
+    else:
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+def read_table(path: str) -> pa.Table:
+    """
+    Relit une table exportée
+
+    Les fichiers .arrow sont memory-mappés (aucune copie, chargement quasi
+    instantané) ; les fichiers .parquet sont décodés via un memory-map.
+    """
+    if path.endswith(".parquet"):
+        return pq.read_table(path, memory_map=True)
+    source = pa.memory_map(path, "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def load_export(paths: Dict[str, str]) -> Tuple[pa.Table, pa.Table]:
+    """Relit un export complet (dict retourné par export_showtimes) → (showtimes, films)"""
+    return read_table(paths["showtimes"]), read_table(paths["films"])
+
+
+def load_exports(location: str) -> Tuple[pa.Table, pa.Table]:
+    """
+    Relit et fusionne plusieurs exports (ex: tous les batches d'une semaine)
+
+    Args:
+        location: Dossier contenant les exports, ou glob
+            (ex: 'output/weekly/ugc_multiple_20260113_*')
+
+    Returns:
+        (showtimes, films) : séances concaténées avec dictionnaires unifiés,
+        films dédoublonnés sur film_id (l'export le plus récent l'emporte)
+    """
+    pattern = os.path.join(location, "ugc_*") if os.path.isdir(location) else location
+    showtimes_paths = sorted(
+        path for path in glob.glob(pattern)
+        if path.endswith(("_showtimes.arrow", "_showtimes.parquet"))
+    )
+    if not showtimes_paths:
+        raise FileNotFoundError(f"Aucun export trouvé: {location}")
+
+    showtimes_tables, films_tables = [], []
+    for path in showtimes_paths:
+        showtimes_tables.append(read_table(path))
+        prefix, ext = path.rsplit("_showtimes.", 1)
+        films_tables.append(read_table(f"{prefix}_films.{ext}"))
+
+    showtimes = pa.concat_tables(showtimes_tables).unify_dictionaries()
+    films = pa.concat_tables(films_tables).unify_dictionaries()
+
+    # Dernière occurrence de chaque film_id (exports triés par horodatage)
+    last_index = {}
+    for i, fid in enumerate(films.column("film_id").to_pylist()):
+        last_index[fid] = i
+    films = films.take(sorted(last_index.values()))
+
+    return showtimes, films
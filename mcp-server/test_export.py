@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test de l'export colonnaire des seances (Arrow IPC / Parquet)
+Utilise les donnees brutes deja scrapees (scraped_data_57_*.json), sans reseau
+"""
+import os
+import json
+import time
+import tempfile
+
+from showtimes_export import export_showtimes, load_export, load_exports, build_tables
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PATH = os.path.join(SERVER_DIR, "scraped_data_57_20260113_144311.json")
+
+
+def load_sample() -> dict:
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_build_tables():
+    """Une ligne par seance, une ligne par film, colonnes texte en dictionnaire"""
+    result = load_sample()
+    showtimes, films = build_tables([result, {"success": False, "error": "x"}])
+
+    expected_rows = sum(
+        len(seances) for film in result["films"] for seances in film["showings"].values()
+    )
+    assert showtimes.num_rows == expected_rows
+    assert films.num_rows == len(result["films"])
+    assert showtimes.schema.field("version").type.value_type == "string"
+
+    versions = showtimes.column("version").combine_chunks()
+    assert len(versions.dictionary) < 10
+
+
+def test_roundtrip():
+    """Arrow et Parquet relisent exactement les tables ecrites"""
+    result = load_sample()
+    showtimes, films = build_tables([result])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("arrow", "parquet"):
+            paths = export_showtimes([result], tmp, label="57", fmt=fmt)
+            loaded_showtimes, loaded_films = load_export(paths)
+            assert loaded_showtimes.equals(showtimes), fmt
+            assert loaded_films.equals(films), fmt
+
+
+def test_load_exports_merges_batches():
+    """Deux exports (deux batches de cinemas) relus et fusionnes depuis un dossier"""
+    result_57 = load_sample()
+    result_42 = load_sample()
+    result_42["cinema"] = {"id": 42, "name": "UGC Montparnasse"}
+    result_42["films"] = result_42["films"][:10]
+
+    showtimes_57, _ = build_tables([result_57])
+    showtimes_42, _ = build_tables([result_42])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_showtimes([result_57], tmp, label="57")
+        export_showtimes([result_42], tmp, label="42", fmt="parquet")
+
+        showtimes, films = load_exports(tmp)
+        assert showtimes.num_rows == showtimes_57.num_rows + showtimes_42.num_rows
+        assert sorted(set(showtimes.column("cinema_id").to_pylist())) == [42, 57]
+
+        # Films communs aux deux batches dedoublonnes
+        film_ids = films.column("film_id").to_pylist()
+        assert len(film_ids) == len(set(film_ids)) == len(result_57["films"])
+
+        # Dictionnaires unifies entre les fichiers
+        chunks = showtimes.column("cinema_name").chunks
+        assert len(chunks) == 2
+        assert chunks[0].dictionary.equals(chunks[1].dictionary)
+
+        # Meme label dans la meme seconde : pas d'ecrasement
+        first = export_showtimes([result_42], tmp, label="42")
+        second = export_showtimes([result_42], tmp, label="42")
+        assert first["showtimes"] != second["showtimes"]
+
+        # Glob sur un seul batch
+        showtimes, _ = load_exports(os.path.join(tmp, "ugc_57_*"))
+        assert showtimes.num_rows == showtimes_57.num_rows
+
+
+def main():
+    """Point d'entree principal : taille et temps de rechargement vs JSON"""
+    result = load_sample()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = export_showtimes([result], tmp, label="57")
+
+        start = time.perf_counter()
+        showtimes, films = load_export(paths)
+        arrow_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        load_sample()
+        json_ms = (time.perf_counter() - start) * 1000
+
+        arrow_size = sum(os.path.getsize(p) for p in paths.values())
+        print(f"[EXPORT] {showtimes.num_rows} seances, {films.num_rows} films")
+        print(f"   - Arrow: {arrow_size} octets, rechargement {arrow_ms:.2f} ms")
+        print(f"   - JSON:  {os.path.getsize(SAMPLE_PATH)} octets, rechargement {json_ms:.2f} ms")
+
+    test_build_tables()
+    test_roundtrip()
+    test_load_exports_merges_batches()
+    print("[OK] Export colonnaire valide")
+
+
+if __name__ == "__main__":
+    main()
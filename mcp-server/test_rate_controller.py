@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test du controleur adaptatif (AIMD) sans reseau
+Les reponses de ugc.fr sont simulees par FakeResponse
+"""
+import time
+
+from rate_controller import AdaptiveController
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def fake_get(statuses: list):
+    """GET simule qui renvoie les codes HTTP dans l'ordre"""
+    calls = []
+
+    def http_get(url, **kwargs):
+        calls.append(kwargs)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        if isinstance(status, Exception):
+            raise status
+        return FakeResponse(status)
+
+    http_get.calls = calls
+    return http_get
+
+
+def make_controller(**kwargs) -> AdaptiveController:
+    params = dict(initial_rate=1000.0, max_rate=1000.0, backoff_base=0.001, backoff_cap=0.01)
+    params.update(kwargs)
+    return AdaptiveController(**params)
+
+
+def test_window_grows_on_success():
+    """Fenetre et debit augmentent tant que les reponses sont rapides"""
+    controller = make_controller(initial_window=1.0, initial_rate=10.0)
+    http_get = fake_get([200])
+    for _ in range(20):
+        controller.get(http_get, "https://www.ugc.fr")
+
+    stats = controller.stats()
+    assert stats["window"] > 1.0
+    assert stats["rate_per_s"] > 10.0
+    assert stats["requests"] == 20
+    assert stats["retries"] == 0
+    assert http_get.calls[0]["timeout"] == controller.timeout
+
+
+def test_window_shrinks_on_rising_latency():
+    """Latence qui derape sans erreur : diminution multiplicative"""
+    controller = make_controller(initial_window=4.0)
+    http_get = fake_get([200])
+    controller.get(http_get, "https://www.ugc.fr")
+
+    def slow_get(url, **kwargs):
+        time.sleep(0.2)
+        return FakeResponse(200)
+
+    for _ in range(5):
+        controller.get(slow_get, "https://www.ugc.fr")
+    assert controller.stats()["window"] < 4.0
+    assert controller.stats()["retries"] == 0
+
+
+def test_latency_alone_does_not_collapse_rate():
+    """Une reponse rapide puis des 2xx plus lents mais stables : le debit reste
+    au-dessus du plancher latence puis remonte (minimum glissant par endpoint)"""
+    controller = make_controller(
+        initial_rate=20.0, latency_min_rate=10.0, latency_slack=0.01, latency_window=5
+    )
+    controller.get(fake_get([200]), "https://www.ugc.fr/ajax")
+
+    def slow_get(url, **kwargs):
+        time.sleep(0.05)
+        return FakeResponse(200)
+
+    rates = []
+    for _ in range(15):
+        controller.get(slow_get, "https://www.ugc.fr/ajax")
+        rates.append(controller.stats()["rate_per_s"])
+
+    assert min(rates) >= 10.0 > controller.min_rate
+    assert rates[-1] > min(rates)
+    assert controller.stats()["window"] > 1.0
+
+
+def test_retry_then_success_on_429_and_5xx():
+    """429 puis 503 : retries avec backoff, fenetre et debit divises par deux"""
+    controller = make_controller(initial_window=4.0)
+    http_get = fake_get([429, 503, 200])
+    response = controller.get(http_get, "https://www.ugc.fr")
+
+    stats = controller.stats()
+    assert response.status_code == 200
+    assert stats["retries"] == 2
+    assert stats["throttled"] == 1
+    assert stats["errors"] == 1
+    assert stats["window"] < 4.0
+
+
+def test_network_error_retried():
+    """Les erreurs reseau (OSError, dont requests.RequestException) sont reessayees"""
+    controller = make_controller()
+    http_get = fake_get([ConnectionError("reset"), 200])
+    assert controller.get(http_get, "https://www.ugc.fr").status_code == 200
+    assert controller.stats()["retries"] == 1
+
+
+def test_gives_up_after_max_retries():
+    """Apres max_retries, l'erreur HTTP remonte ; les 404 ne sont pas reessayes"""
+    controller = make_controller(max_retries=2)
+    try:
+        controller.get(fake_get([500]), "https://www.ugc.fr")
+        assert False, "HTTP 500 aurait du remonter"
+    except RuntimeError:
+        pass
+    assert controller.stats()["retries"] == 2
+
+    try:
+        controller.get(fake_get([404]), "https://www.ugc.fr")
+        assert False, "HTTP 404 aurait du remonter"
+    except RuntimeError:
+        pass
+    assert controller.stats()["retries"] == 2
+
+
+def test_slot_released_on_unexpected_error():
+    """Une exception hors OSError libere la place dans la fenetre"""
+    controller = make_controller(initial_window=1.0)
+    try:
+        controller.get(fake_get([ValueError("bug")]), "https://www.ugc.fr")
+        assert False, "ValueError aurait du remonter"
+    except ValueError:
+        pass
+    # Verifie avant le GET suivant, qui bloquerait indefiniment si la place avait fui
+    assert controller._in_flight == 0
+    assert controller.get(fake_get([200]), "https://www.ugc.fr").status_code == 200
+
+
+def test_4xx_does_not_grow_window():
+    """404 : ni augmentation ni retry ; 403 (anti-bot) : diminution"""
+    controller = make_controller(initial_window=4.0)
+    for status in (404, 403):
+        try:
+            controller.get(fake_get([status]), "https://www.ugc.fr")
+            assert False, f"HTTP {status} aurait du remonter"
+        except RuntimeError:
+            pass
+        if status == 404:
+            assert controller.stats()["window"] == 4.0
+
+    stats = controller.stats()
+    assert stats["window"] < 4.0
+    assert stats["throttled"] == 1
+    assert stats["retries"] == 0
+
+
+def main():
+    """Point d'entree principal"""
+    test_window_grows_on_success()
+    test_window_shrinks_on_rising_latency()
+    test_latency_alone_does_not_collapse_rate()
+    test_retry_then_success_on_429_and_5xx()
+    test_network_error_retried()
+    test_gives_up_after_max_retries()
+    test_slot_released_on_unexpected_error()
+    test_4xx_does_not_grow_window()
+    print("[OK] Controleur adaptatif valide")
+
+
+if __name__ == "__main__":
+    main()
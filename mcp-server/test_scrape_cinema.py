@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test de scrape_cinema sans reseau
+_get_available_dates et _scrape_day sont remplaces par des stubs
+"""
+import json
+
+import server
+from scraper_ugc import UGCScraper
+
+DATES = ["2026-01-13", "2026-01-14", "2026-01-15"]
+
+
+def make_scraper(scrape_day) -> UGCScraper:
+    scraper = UGCScraper()
+    scraper._get_available_dates = lambda url: DATES
+    scraper._scrape_day = scrape_day
+    return scraper
+
+
+def film_for(date_str: str) -> dict:
+    return {
+        "film_id": "17892",
+        "title": "PARASAKTHI (TAMOUL)",
+        "duration": "2h43",
+        "showings": {date_str: [{"start": "17:10", "end": "20:05", "version": "VOSTF"}]},
+    }
+
+
+def test_failed_day_does_not_fail_cinema():
+    """Une date en echec reseau/HTTP est listee dans failed_dates, le cinema reste valide"""
+    def scrape_day(cinema_id, date_str):
+        if date_str == "2026-01-14":
+            raise ConnectionError("HTTP 503 apres retries")
+        return [film_for(date_str)]
+
+    result = make_scraper(scrape_day).scrape_cinema(57)
+
+    assert result["success"]
+    assert result["failed_dates"] == ["2026-01-14"]
+    assert sorted(result["films"][0]["showings"]) == ["2026-01-13", "2026-01-15"]
+
+    # failed_dates remonte jusqu'au content[0] lu par le client Node
+    formatted = json.loads(server.format_for_llm(result))
+    assert formatted["failed_dates"] == ["2026-01-14"]
+
+
+def test_all_days_failed():
+    """Toutes les dates en echec : le cinema est en erreur"""
+    def scrape_day(cinema_id, date_str):
+        raise ConnectionError("reset")
+
+    result = make_scraper(scrape_day).scrape_cinema(57)
+    assert not result["success"]
+
+
+def test_parsing_error_fails_cinema():
+    """Une erreur de parsing n'est pas masquee en date manquante"""
+    def scrape_day(cinema_id, date_str):
+        if date_str == "2026-01-14":
+            raise KeyError("href")
+        return [film_for(date_str)]
+
+    result = make_scraper(scrape_day).scrape_cinema(57)
+    assert not result["success"]
+    assert "failed_dates" not in result
+
+
+def main():
+    """Point d'entree principal"""
+    test_failed_day_does_not_fail_cinema()
+    test_all_days_failed()
+    test_parsing_error_fails_cinema()
+    print("[OK] scrape_cinema valide")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Genere les fichiers JSON et Markdown exactement comme recus par llmService
 import json
 from datetime import datetime
 from scraper_ugc import scraper
+from showtimes_export import export_showtimes
 
 def format_for_llm(result: dict) -> str:
     """
@@ -13,7 +14,7 @@ def format_for_llm(result: dict) -> str:
     (IDENTIQUE a la fonction dans server.py)
 
     Retourne un JSON compact avec:
-    - Infos cinema
+    - Infos cinema (+ dates en echec apres retries, failed_dates)
     - Liste des films avec metadonnees
     - Seances groupees par date (limite a 3 prochaines dates)
     """
@@ -74,6 +75,7 @@ def format_for_llm(result: dict) -> str:
     cinema_data = {
         "cinema_id": cinema.get("id"),
         "cinema_name": cinema.get("name"),
+        "failed_dates": result.get("failed_dates", []),
         "films": formatted_films
     }
 
@@ -103,6 +105,8 @@ def test_single_cinema(cinema_id: int, cinema_name: str = ""):
     print(f"   - Films avec seances: {result['film_count']}")
     print(f"   - Films filtres (sans seances): {result['films_filtered']}")
     print(f"   - Dates disponibles: {len(result['available_dates'])}")
+    print(f"   - Controleur: fenetre {result['scraping']['window']}, "
+          f"{result['scraping']['retries']} retries, dates en echec: {result['failed_dates']}")
 
     # Generation timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -127,7 +131,11 @@ def test_single_cinema(cinema_id: int, cinema_name: str = ""):
     print(f"   - Taille: {len(scraped_content)} caracteres")
     print(f"   - Nombre de films: {len(parsed['films'])}")
 
-    # 4. Affichage apercu
+    # 4. Export colonnaire (Arrow IPC) : seances + metadonnees films
+    export_paths = export_showtimes([result], "output", label=str(cinema_id))
+    print(f"[FILE] Export Arrow sauvegarde: {export_paths['showtimes']}, {export_paths['films']}")
+
+    # 5. Affichage apercu
     print(f"\n{'-'*60}")
     print("[PREVIEW] APERCU DU JSON LLM (premiers 2 films):")
     print(f"{'-'*60}")
@@ -153,6 +161,7 @@ def test_multiple_cinemas(cinema_ids: list):
     print(f"{'='*60}\n")
 
     all_cinemas = []
+    all_results = []
     total_films = 0
     total_filtered = 0
 
@@ -164,6 +173,7 @@ def test_multiple_cinemas(cinema_ids: list):
             # Parse le JSON de chaque cinema
             cinema_json = json.loads(format_for_llm(result))
             all_cinemas.append(cinema_json)
+            all_results.append(result)
             total_films += result.get("film_count", 0)
             total_filtered += result.get("films_filtered", 0)
             print(f"   [OK] {result['film_count']} films avec seances ({result.get('films_filtered', 0)} filtres)")
@@ -190,6 +200,11 @@ def test_multiple_cinemas(cinema_ids: list):
     print(f"   - Nombre de cinemas: {len(all_cinemas)}")
     print(f"   - Taille: {len(json.dumps(combined_data, ensure_ascii=False))} caracteres")
 
+    # Export colonnaire de tous les cinemas
+    if all_results:
+        export_paths = export_showtimes(all_results, "output", label="multiple")
+        print(f"[FILE] Export Arrow sauvegarde: {export_paths['showtimes']}, {export_paths['films']}")
+
     # Apercu
     print(f"\n{'-'*60}")
     print("[PREVIEW] Structure du JSON combine:")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test de regression du temps de demarrage du serveur MCP
+Verifie que tools/list repond sans importer requests/bs4 et que le surcout du
+serveur par rapport a un interpreteur Python nu reste dans le budget
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_PATH = os.path.join(SERVER_DIR, "server.py")
+
+# Budget du surcout du serveur (spawn + tools/list) par rapport a
+# `python -c pass` mesure dans le meme test, en ms
+STARTUP_OVERHEAD_BUDGET_MS = float(os.environ.get("MCP_STARTUP_OVERHEAD_MS", "25"))
+RUNS = 5
+
+
+def measure_interpreter_ms() -> float:
+    """
+    Temps jusqu'a la premiere ligne ecrite par un interpreteur Python nu
+    (reference de la machine, mesuree comme measure_first_response_ms)
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "print('ok', flush=True)"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    proc.stdout.readline()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    proc.wait(timeout=10)
+    return elapsed_ms
+
+
+def measure_first_response_ms() -> float:
+    """
+    Lance server.py et mesure le temps jusqu'a la reponse a un handshake
+    tools/list. Ce n'est pas le chemin du client Node (mcpClient.js envoie
+    directement un tools/call, dont la premiere reponse reste un scraping complet).
+    """
+    env = dict(os.environ, MCP_PREWARM="0")
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, SERVER_PATH],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        text=True,
+    )
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    proc.stdin.write(json.dumps(request) + "\n")
+    proc.stdin.flush()
+    line = proc.stdout.readline()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    proc.stdin.close()
+    proc.wait(timeout=10)
+
+    response = json.loads(line)
+    assert response["id"] == 1
+    assert len(response["result"]["tools"]) == 2
+    return elapsed_ms
+
+
+def test_heavy_modules_not_imported():
+    """L'import de server.py ne doit pas charger requests ni bs4"""
+    code = (
+        "import sys; sys.path.insert(0, %r); import server; "
+        "print(','.join(m for m in ('requests', 'bs4') if m in sys.modules))"
+    ) % SERVER_DIR
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "", f"Modules charges au demarrage: {out.stdout.strip()}"
+
+
+def measure_startup() -> dict:
+    """
+    Meilleurs temps (ms) sur RUNS lancements alternes : interpreteur nu et
+    serveur jusqu'a la reponse a tools/list
+    """
+    interpreter, server = [], []
+    for _ in range(RUNS):
+        interpreter.append(measure_interpreter_ms())
+        server.append(measure_first_response_ms())
+    return {
+        "interpreter": min(interpreter),
+        "server": min(server),
+        "overhead": min(server) - min(interpreter),
+    }
+
+
+def check_startup_budget(timings: dict):
+    assert timings["overhead"] <= STARTUP_OVERHEAD_BUDGET_MS, (
+        f"tools/list en {timings['server']:.1f} ms, soit {timings['overhead']:.1f} ms "
+        f"de plus que l'interpreteur (budget {STARTUP_OVERHEAD_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_tools_list_within_budget():
+    """Le surcout du serveur sur l'interpreteur nu doit tenir dans le budget"""
+    check_startup_budget(measure_startup())
+
+
+def main():
+    """Point d'entree principal"""
+    timings = measure_startup()
+    print(f"[STARTUP] interpreteur: {timings['interpreter']:.1f} ms, "
+          f"tools/list: {timings['server']:.1f} ms, "
+          f"surcout: {timings['overhead']:.1f} ms (budget {STARTUP_OVERHEAD_BUDGET_MS:.0f} ms)")
+
+    test_heavy_modules_not_imported()
+    print("[OK] requests/bs4 non charges au demarrage")
+
+    check_startup_budget(timings)
+    print("[OK] Temps de demarrage dans le budget")
+
+
+if __name__ == "__main__":
+    main()